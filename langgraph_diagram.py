@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+Generate the ThinkingCindyAgent LangGraph architecture diagram.
+
+Renders the four-phase agent flow (input -> thinking -> tools -> synthesis)
+together with the available tool set, hashtag tool forcing, the streaming
+process and the LLM integration points, and saves the result as
+langgraph_architecture.svg for the docs.
+"""
+
+import hashlib
+import math
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+
+# matplotlib is imported lazily inside the render path: importing this
+# module (or hitting the source-hash cache) then costs milliseconds instead
+# of matplotlib's full startup.
+
+
+@dataclass(frozen=True)
+class Phase:
+    """Geometry and labelling for one phase box in the agent flow."""
+    x: float
+    y: float
+    w: float
+    h: float
+    color: str
+    title: str
+    func: str
+    bullets: tuple
+
+
+# Color scheme for every section; parsed to RGBA tuples once per render so
+# each patch receives a ready-made value instead of re-parsing a hex string
+# in set_facecolor at construction/draw time.
+COLORS = {
+    'input': '#E3F2FD',      # light blue
+    'thinking': '#F3E5F5',   # light purple
+    'tools': '#E8F5E9',      # light green
+    'synthesis': '#FFF3E0',  # light orange
+    'available': '#F5F5F5',  # light grey
+    'hashtag': '#FFF9C4',    # pale yellow
+    'streaming': '#E1F5FE',  # pale blue
+    'llm': '#FCE4EC',        # pale pink
+}
+
+PHASES = (
+    Phase(1, 9.4, 3, 1.4, 'input', 'PHASE 1: INPUT', 'analyzeInput()',
+          ('Parse hashtags', 'Extract clean input', 'Identify forced tools')),
+    Phase(6, 9.4, 3, 1.4, 'thinking', 'PHASE 2: THINKING', 'createThinkingPlan()',
+          ('LLM planning call', 'Tool suggestion', 'Create execution plan')),
+    Phase(11, 9.4, 3, 1.4, 'tools', 'PHASE 3: TOOLS', 'executeTools()',
+          ('Run planned tools', 'Collect results', 'Handle errors')),
+    Phase(6, 7.4, 3, 1.4, 'synthesis', 'PHASE 4: SYNTHESIS', 'synthesizeResponse()',
+          ('Final LLM call', 'Combine tool results', 'Generate citations')),
+)
+
+
+@lru_cache(maxsize=128)
+def _shaped(text, size):
+    """Glyph path for one line of text at `size` points.
+
+    Cached at module scope so FreeType shapes each distinct (text, size)
+    pair at most once per process -- repeat renders (build watchers, module
+    reloads) reuse the shaped paths.
+    """
+    from matplotlib.textpath import TextPath
+    return TextPath((0, 0), text, size=size)
+
+
+def _shaped_lines(x, y, lines, size, ha='center', line_spacing=1.2):
+    """Lay out `lines` below data point (x, y) as pre-shaped glyph paths.
+
+    Everything is expressed in data units -- the axes span 16x12 data units
+    over a 16x12 inch figure, so one data unit is 72 text points -- which
+    keeps the placement independent of whatever dpi the backend renders at
+    (print_svg, for one, forces figure.dpi to 72 before drawing).
+    """
+    from matplotlib.patches import PathPatch
+    from matplotlib.transforms import Affine2D
+
+    pt = 1 / 72.0  # data units per text point
+    patches = []
+    for i, line in enumerate(lines):
+        path = _shaped(line, size)
+        # First baseline sits roughly one ascent below the anchor (va='top')
+        offset_y = y - (0.8 + i * line_spacing) * size * pt
+        offset_x = x - path.get_extents().width * pt / 2 if ha == 'center' else x
+        transform = Affine2D().scale(pt).translate(offset_x, offset_y)
+        patches.append(PathPatch(path, transform=transform))
+    return patches
+
+
+def create_langgraph_diagram(out_path=None):
+    """Create a visual diagram of the ThinkingCindyAgent LangGraph architecture.
+
+    `out_path` overrides the destination SVG (used by the tests); by default
+    the diagram is written next to this script regardless of where it is
+    invoked from.
+    """
+    # Fail before any rendering happens if the destination is not writable.
+    if out_path is None:
+        out_path = Path(__file__).with_name('langgraph_architecture.svg')
+    out_path = Path(out_path)
+    cache_path = out_path.with_name(out_path.name + '.cache')
+    if not os.access(out_path.parent, os.W_OK):
+        raise RuntimeError(f"cannot write diagram output to {out_path.parent}")
+
+    # The diagram only changes when this script does, so key the output on a
+    # hash of the source and skip the (multi-second) matplotlib render when
+    # the SVG on disk is already up to date.
+    with open(__file__, 'rb') as f:
+        source_key = hashlib.blake2b(f.read()).hexdigest()[:16]
+    if out_path.exists() and cache_path.exists():
+        with open(cache_path) as f:
+            if f.read().strip() == source_key:
+                print("langgraph_architecture.svg is up to date (cached)")
+                return
+
+    # Only an actual render pays for matplotlib startup; the Agg backend is
+    # never probed because the canvas below is constructed explicitly.
+    from matplotlib import rc_context
+    from matplotlib.backends.backend_svg import FigureCanvasSVG
+    from matplotlib.collections import LineCollection, PatchCollection
+    from matplotlib.colors import to_rgba
+    from matplotlib.figure import Figure
+    from matplotlib.patches import BoxStyle, FancyBboxPatch
+
+    # Pre-parse the palette and the shared label frame once per render so
+    # no artist re-parses color or boxstyle strings on the draw path.
+    colors = {key: to_rgba(hex_color) for key, hex_color in COLORS.items()}
+    bbox_white = dict(boxstyle=BoxStyle.Round(pad=0.3), facecolor=(1, 1, 1, 1))
+
+    # One-shot build-time render: simplify paths as aggressively as allowed.
+    # Hinting and chunksize knobs are deliberately absent -- SVG text goes
+    # through TextToPath, which loads glyphs unhinted regardless, and
+    # agg.path.chunksize only affects the Agg backend.
+    with rc_context({'path.simplify': True, 'path.simplify_threshold': 1.0}):
+        # Build the Figure and canvas directly rather than through pyplot: this
+        # skips GUI backend autodetection and keeps the figure out of pyplot's
+        # global registry, so repeated invocations (e.g. from a build watcher)
+        # cannot accumulate open figures -- no plt.close() bookkeeping needed.
+        fig = Figure(figsize=(16, 12), facecolor='white')
+        canvas = FigureCanvasSVG(fig)
+        ax = fig.add_subplot(1, 1, 1)
+        # Every artist is placed at fixed data coordinates in a fixed 16x12
+        # world, so no layout engine or bbox probing is ever needed.
+        fig.set_layout_engine('none')
+        # Axis off first so the limit changes never touch tick machinery,
+        # then stretch the axes over the whole figure: one data unit becomes
+        # exactly one inch and the default subplot margins disappear.
+        ax.axis('off')
+        ax.set_position([0, 0, 1, 1])
+        ax.set_xlim(0, 16)
+        ax.set_ylim(0, 12)
+
+        # Title
+        ax.text(8, 11.5, 'ThinkingCindyAgent - LangGraph Architecture',
+                fontsize=20, fontweight='bold', ha='center')
+
+        # All FancyBboxPatch boxes are batched into a single PatchCollection --
+        # adding each one through ax.add_patch() triggers a per-patch limits
+        # update and a separate draw dispatch per artist. The four phase boxes
+        # come from the PHASES spec; the supporting sections are listed inline.
+        boxes = [
+            FancyBboxPatch((p.x, p.y), p.w, p.h, boxstyle="round,pad=0.1",
+                           facecolor=colors[p.color], edgecolor='black', linewidth=2)
+            for p in PHASES
+        ]
+        boxes += [
+            # Available tools
+            FancyBboxPatch((1, 5.4), 6.1, 1.7, boxstyle="round,pad=0.1",
+                           facecolor=colors['available'], edgecolor='black', linewidth=1.5),
+            # Hashtag tool forcing
+            FancyBboxPatch((8.9, 5.4), 6.1, 1.7, boxstyle="round,pad=0.1",
+                           facecolor=colors['hashtag'], edgecolor='black', linewidth=1.5),
+            # Streaming process
+            FancyBboxPatch((1, 3.4), 14, 1.7, boxstyle="round,pad=0.1",
+                           facecolor=colors['streaming'], edgecolor='blue', linewidth=2),
+            # LLM integration points
+            FancyBboxPatch((1, 1.5), 14, 1.7, boxstyle="round,pad=0.1",
+                           facecolor=colors['llm'], edgecolor='purple', linewidth=2),
+        ]
+        ax.add_collection(PatchCollection(boxes, match_original=True))
+
+        # The bullet-list bodies are identical strings on every render, so
+        # they are drawn from the module-level shaped-path cache and batched
+        # into a single collection.
+        text_paths = []
+
+        # Phase titles, function names and bullet lists
+        for p in PHASES:
+            cx = p.x + p.w / 2
+            ax.text(cx, p.y + 0.7, p.title, fontsize=12, fontweight='bold', ha='center')
+            ax.text(cx, p.y + 0.45, p.func, fontsize=10, style='italic', ha='center')
+            text_paths += _shaped_lines(cx, p.y + 0.4,
+                                        ['• ' + b for b in p.bullets], 9)
+
+        # Available tools -- each column laid out from cached per-line paths
+        ax.text(4.05, 6.75, 'AVAILABLE TOOLS', fontsize=13, fontweight='bold', ha='center')
+        text_paths += _shaped_lines(2.1, 6.55,
+                                    ['• search_documents', '• read_file', '• write_file'],
+                                    10, ha='left', line_spacing=1.4)
+        text_paths += _shaped_lines(4.65, 6.55,
+                                    ['• web_search', '• brave_search', '• list_directory'],
+                                    10, ha='left', line_spacing=1.4)
+
+        # Hashtag tool forcing
+        ax.text(11.95, 6.75, 'HASHTAG TOOL FORCING', fontsize=13, fontweight='bold', ha='center')
+        text_paths += _shaped_lines(9.95, 6.55,
+                                    ['#search → search_documents', '#read → read_file',
+                                     '#web → web_search_preferred'],
+                                    10, ha='left', line_spacing=1.4)
+        text_paths += _shaped_lines(12.9, 6.55,
+                                    ['#write → write_file', '#brave → brave_search',
+                                     '#dir → list_directory'],
+                                    10, ha='left', line_spacing=1.4)
+
+        # add_collection gives the collection transData, mapping the
+        # data-space glyph paths to output coordinates at draw time.
+        glyphs = PatchCollection(text_paths, facecolor=(0, 0, 0, 1), edgecolor='none')
+        ax.add_collection(glyphs, autolim=False)
+
+        # Streaming process
+        ax.text(8, 4.8, 'STREAMING PROCESS (processStreaming)', fontsize=14,
+                fontweight='bold', ha='center')
+        ax.text(2.65, 4.35, '<think> blocks', fontsize=10, ha='center',
+                bbox=bbox_white)
+        ax.text(5.65, 4.35, '<tool> execution', fontsize=10, ha='center',
+                bbox=bbox_white)
+        ax.text(9.1, 4.35, 'Real-time progress', fontsize=10, ha='center',
+                bbox=bbox_white)
+        ax.text(12.55, 4.35, 'Structured output', fontsize=10, ha='center',
+                bbox=bbox_white)
+        ax.text(8, 3.85, 'Emits structured tokens for UI rendering: thinking blocks, '
+                'tool calls, progress updates', fontsize=11, style='italic', ha='center')
+
+        # LLM integration points
+        ax.text(8, 2.8, 'LLM INTEGRATION POINTS', fontsize=14, fontweight='bold', ha='center')
+        ax.text(3.05, 2.4, '1. Planning Call', fontsize=10, ha='center',
+                bbox=bbox_white)
+        ax.text(8, 2.4, '2. Direct Response', fontsize=10, ha='center',
+                bbox=bbox_white)
+        ax.text(12.95, 2.4, '3. Synthesis Call', fontsize=10, ha='center',
+                bbox=bbox_white)
+        ax.text(3.05, 2.1, 'createThinkingPlan()', fontsize=9, style='italic', ha='center')
+        ax.text(8, 2.1, 'Simple greetings', fontsize=9, style='italic', ha='center')
+        ax.text(12.95, 2.1, 'synthesizeResponse()', fontsize=9, style='italic', ha='center')
+        ax.text(8, 1.8, 'Smart routing: Simple greetings = 1 call | Complex requests = 2 calls',
+                fontsize=11, style='italic', ha='center', color='purple')
+
+        # Flow arrows between the phases and supporting sections: all shafts
+        # go into one LineCollection instead of five ConnectionPatch artists,
+        # with a rotated triangle marker at each tip for the head.
+        arrows = [
+            ((4, 10.1), (6, 10.1)),       # input -> thinking
+            ((9, 10.1), (11, 10.1)),      # thinking -> tools
+            ((12.1, 9.35), (7.6, 8.75)),  # tools -> synthesis
+            ((11.8, 5.6), (2.9, 9.4)),    # hashtag forcing -> input
+            ((4.2, 5.6), (12.1, 9.4)),    # available tools -> tool execution
+        ]
+        ax.add_collection(LineCollection(arrows, colors='black', linewidths=1.5))
+        # scatter rotates its marker once per call, so tips are grouped by
+        # shaft angle (the two horizontal arrows share one call).
+        tips = {}
+        for (x0, y0), (x1, y1) in arrows:
+            angle = round(math.degrees(math.atan2(y1 - y0, x1 - x0)) - 90, 1)
+            tips.setdefault(angle, []).append((x1, y1))
+        for angle, points in tips.items():
+            xs, ys = zip(*points)
+            ax.scatter(xs, ys, marker=(3, 0, angle), s=50, color='black')
+
+        # Footer
+        ax.text(8, 0.7, 'ThinkingCindyAgent: Multi-phase AI reasoning with tool '
+                'execution and streaming output', fontsize=14, style='italic',
+                ha='center', color='gray')
+
+        # Vector output: the SVG backend writes drawing operators directly, so
+        # the cost is proportional to the number of primitives instead of the
+        # millions of pixels Agg would rasterize for a PNG of this size.
+        canvas.print_svg(out_path)
+    with open(cache_path, 'w') as f:
+        f.write(source_key)
+    print("LangGraph architecture diagram saved to langgraph_architecture.svg")
+
+
+if __name__ == '__main__':
+    create_langgraph_diagram()
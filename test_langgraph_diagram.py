@@ -0,0 +1,94 @@
+"""Smoke tests for the LangGraph architecture diagram generator."""
+
+import re
+import xml.etree.ElementTree as ET
+
+import pytest
+
+pytest.importorskip('matplotlib')
+
+from langgraph_diagram import create_langgraph_diagram
+
+SVG = '{http://www.w3.org/2000/svg}'
+IDENTITY = (1, 0, 0, 1, 0, 0)
+
+
+def _render(tmp_path):
+    out_path = tmp_path / 'langgraph_architecture.svg'
+    create_langgraph_diagram(out_path)
+    return out_path
+
+
+def _compose(m, n):
+    """Affine matrix product m @ n, both as (a, b, c, d, e, f)."""
+    return (m[0] * n[0] + m[2] * n[1],
+            m[1] * n[0] + m[3] * n[1],
+            m[0] * n[2] + m[2] * n[3],
+            m[1] * n[2] + m[3] * n[3],
+            m[0] * n[4] + m[2] * n[5] + m[4],
+            m[1] * n[4] + m[3] * n[5] + m[5])
+
+
+def _parse_transform(attr):
+    """Affine matrix for an SVG transform attribute (translate/scale/matrix)."""
+    matrix = IDENTITY
+    for name, args in re.findall(r'(\w+)\(([^)]*)\)', attr or ''):
+        values = [float(v) for v in re.split(r'[\s,]+', args.strip())]
+        if name == 'translate':
+            step = (1, 0, 0, 1, values[0], values[1] if len(values) > 1 else 0)
+        elif name == 'scale':
+            step = (values[0], 0, 0, values[-1], 0, 0)
+        elif name == 'matrix':
+            step = tuple(values)
+        else:
+            continue
+        matrix = _compose(matrix, step)
+    return matrix
+
+
+def _placed_points(element, matrix, points):
+    """Collect absolute (x, y) pairs for every placed path and glyph use.
+
+    The <defs> subtree is skipped: it holds reusable geometry around the
+    origin that only gets a position through <use> references.
+    """
+    if element.tag == SVG + 'defs':
+        return
+    matrix = _compose(matrix, _parse_transform(element.get('transform')))
+    coords = []
+    if element.tag == SVG + 'path':
+        numbers = [float(v) for v in
+                   re.findall(r'-?\d+\.?\d*(?:e-?\d+)?', element.get('d', ''))]
+        coords = list(zip(numbers[::2], numbers[1::2]))
+    elif element.tag == SVG + 'use':
+        coords = [(float(element.get('x', 0)), float(element.get('y', 0)))]
+    for x, y in coords:
+        points.append((matrix[0] * x + matrix[2] * y + matrix[4],
+                       matrix[1] * x + matrix[3] * y + matrix[5]))
+    for child in element:
+        _placed_points(child, matrix, points)
+
+
+def test_writes_svg_and_cache_sidecar(tmp_path):
+    out_path = _render(tmp_path)
+    assert out_path.exists()
+    assert out_path.with_name(out_path.name + '.cache').exists()
+
+
+def test_repeat_run_hits_cache(tmp_path):
+    out_path = _render(tmp_path)
+    first_mtime = out_path.stat().st_mtime_ns
+    create_langgraph_diagram(out_path)
+    assert out_path.stat().st_mtime_ns == first_mtime
+
+
+def test_drawn_coordinates_fall_inside_canvas(tmp_path):
+    root = ET.parse(_render(tmp_path)).getroot()
+    x0, y0, width, height = (float(v) for v in root.get('viewBox').split())
+    points = []
+    _placed_points(root, IDENTITY, points)
+    assert points, 'no drawn geometry found in the SVG'
+    slack = 1  # stroke widths and bezier control points may overshoot a hair
+    for x, y in points:
+        assert x0 - slack <= x <= x0 + width + slack
+        assert y0 - slack <= y <= y0 + height + slack